@@ -54,9 +54,7 @@ def main():
     print("Request reply:", event)
 
     if event.reply_code != socks5.SOCKS5ReplyCode.SUCCEEDED:
-        raise Exception(
-            "Server could not connect to remote host: {}".format(event.reply_code)
-        )
+        raise Exception(f"Server could not connect to remote host: {event.reply_code}")
 
     # Send an HTTP request to the connected proxy
     sock.sendall(b"GET / HTTP/1.1\r\nhost: google.com\r\n\r\n")
@@ -8,6 +8,7 @@ from .socks4 import (
     SOCKS4Reply,
     SOCKS4ReplyCode,
     SOCKS4Request,
+    build_socks4_reply,
 )
 from .socks5 import (
     SOCKS5AType,
@@ -43,4 +44,5 @@ __all__ = [
     "SOCKS5UsernamePasswordRequest",
     "SOCKSError",
     "ProtocolError",
+    "build_socks4_reply",
 ]
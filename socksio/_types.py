@@ -1,3 +1,4 @@
 import typing
 
 StrOrBytes = typing.Union[str, bytes]
+BytesLike = typing.Union[bytes, bytearray, memoryview]
@@ -1,7 +1,8 @@
 import enum
+import struct
 import typing
 
-from ._types import StrOrBytes
+from ._types import BytesLike, StrOrBytes
 from .exceptions import ProtocolError, SOCKSError
 from .utils import (
     AddressType,
@@ -20,6 +21,12 @@ class SOCKS4ReplyCode(bytes, enum.Enum):
     AUTHENTICATION_FAILED = b"\x5D"
 
 
+# Reply codes by integer wire value, so the ints coming out of the reply
+# struct index the dict directly. A dict lookup stays in C, unlike the enum's
+# __call__ which runs Python-level missing-value machinery on the hot path.
+_REPLY_CODES = {code[0]: code for code in SOCKS4ReplyCode}
+
+
 class SOCKS4Command(bytes, enum.Enum):
     """Enumeration of SOCKS4 command codes."""
 
@@ -27,6 +34,12 @@ class SOCKS4Command(bytes, enum.Enum):
     BIND = b"\x02"
 
 
+# Precompiled structs for the fixed-size portions of requests and replies,
+# packing the version/command/port/address fields in a single call.
+_REQUEST_STRUCT = struct.Struct(">B1sH4s")
+_REPLY_STRUCT = struct.Struct(">BBH4s")
+
+
 class SOCKS4Request(typing.NamedTuple):
     """Encapsulates a request to the SOCKS4 proxy server
 
@@ -89,16 +102,12 @@ class SOCKS4Request(typing.NamedTuple):
         if user_id is None:
             raise SOCKSError("SOCKS4 requires a user_id, none was specified")
 
-        return b"".join(
-            [
-                b"\x04",
-                self.command,
-                (self.port).to_bytes(2, byteorder="big"),
-                self.addr,
-                user_id,
-                b"\x00",
-            ]
-        )
+        # Pre-size the buffer and write straight into it, the trailing
+        # null byte is already in place.
+        buf = bytearray(9 + len(user_id))
+        _REQUEST_STRUCT.pack_into(buf, 0, 4, self.command, self.port, self.addr)
+        buf[8:-1] = user_id
+        return bytes(buf)
 
 
 class SOCKS4ARequest(typing.NamedTuple):
@@ -156,18 +165,17 @@ class SOCKS4ARequest(typing.NamedTuple):
         if user_id is None:
             raise SOCKSError("SOCKS4 requires a user_id, none was specified")
 
-        return b"".join(
-            [
-                b"\x04",
-                self.command,
-                (self.port).to_bytes(2, byteorder="big"),
-                b"\x00\x00\x00\xFF",  # arbitrary final non-zero byte
-                user_id,
-                b"\x00",
-                self.addr,
-                b"\x00",
-            ]
+        # Pre-size the buffer and write straight into it, the null bytes
+        # terminating the user ID and address are already in place. The
+        # address field is an arbitrary value with a final non-zero byte.
+        user_id_len = len(user_id)
+        buf = bytearray(10 + user_id_len + len(self.addr))
+        _REQUEST_STRUCT.pack_into(
+            buf, 0, 4, self.command, self.port, b"\x00\x00\x00\xFF"
         )
+        buf[8 : 8 + user_id_len] = user_id
+        buf[9 + user_id_len : -1] = self.addr
+        return bytes(buf)
 
 
 class SOCKS4Reply(typing.NamedTuple):
@@ -184,7 +192,7 @@ class SOCKS4Reply(typing.NamedTuple):
     addr: typing.Optional[str]
 
     @classmethod
-    def loads(cls, data: bytes) -> "SOCKS4Reply":
+    def loads(cls, data: BytesLike) -> "SOCKS4Reply":
         """Unpacks the reply data into an instance.
 
         Returns:
@@ -193,17 +201,39 @@ class SOCKS4Reply(typing.NamedTuple):
         Raises:
             ProtocolError: If the data does not match the spec.
         """
-        if len(data) != 8 or data[0:1] != b"\x00":
+        if len(data) != 8 or data[0] != 0:
             raise ProtocolError("Malformed reply")
 
+        _, raw_code, port, addr = _REPLY_STRUCT.unpack(data)
+
         try:
-            return cls(
-                reply_code=SOCKS4ReplyCode(data[1:2]),
-                port=int.from_bytes(data[2:4], byteorder="big"),
-                addr=decode_address(AddressType.IPV4, data[4:8]),
-            )
-        except ValueError as exc:
-            raise ProtocolError("Malformed reply") from exc
+            reply_code = _REPLY_CODES[raw_code]
+        except KeyError:
+            raise ProtocolError("Malformed reply") from None
+
+        return cls(reply_code, port, decode_address(AddressType.IPV4, addr))
+
+
+def build_socks4_reply(
+    reply_code: typing.Union[int, SOCKS4ReplyCode], port: int, addr: bytes
+) -> bytes:
+    """Packs a raw SOCKS4 reply in a single struct call.
+
+    Useful for server-side code and test harnesses producing the replies
+    that ``SOCKS4Reply.loads`` consumes.
+
+    Args:
+        reply_code: The reply code, either a SOCKS4ReplyCode member or its
+            raw byte value.
+        port: The port number to include in the reply.
+        addr: The packed 4-byte IPv4 address to include in the reply.
+
+    Returns:
+        The packed reply.
+    """
+    if isinstance(reply_code, bytes):
+        reply_code = reply_code[0]
+    return _REPLY_STRUCT.pack(0, reply_code, port, addr)
 
 
 class SOCKS4Connection:
@@ -219,7 +249,7 @@ class SOCKS4Connection:
     def __init__(self, user_id: bytes):
         self.user_id = user_id
 
-        self._data_to_send = bytearray()
+        self._data_to_send: typing.List[bytes] = []
         self._received_data = bytearray()
 
     def send(self, request: typing.Union[SOCKS4Request, SOCKS4ARequest]) -> None:
@@ -229,7 +259,7 @@ class SOCKS4Connection:
             request: The request instance to be packed.
         """
         user_id = request.user_id or self.user_id
-        self._data_to_send += request.dumps(user_id=user_id)
+        self._data_to_send.append(request.dumps(user_id=user_id))
 
     def receive_data(self, data: bytes) -> SOCKS4Reply:
         """Unpacks response data into a reply object.
@@ -241,13 +271,23 @@ class SOCKS4Connection:
             The appropriate reply object.
         """
         self._received_data += data
-        return SOCKS4Reply.loads(bytes(self._received_data))
+        # A memoryview avoids copying the accumulated buffer on every call,
+        # it must be released before the bytearray can grow again.
+        view = memoryview(self._received_data)
+        try:
+            return SOCKS4Reply.loads(view)
+        finally:
+            view.release()
 
     def data_to_send(self) -> bytes:
         """Returns the data to be sent via the I/O library of choice.
 
         Also clears the connection's buffer.
         """
-        data = bytes(self._data_to_send)
-        self._data_to_send = bytearray()
-        return data
+        data = self._data_to_send
+        self._data_to_send = []
+        # The typical case is a single queued request, skip the join's
+        # scan and reallocation and hand its bytes back as-is.
+        if len(data) == 1:
+            return data[0]
+        return b"".join(data)
@@ -1,4 +1,6 @@
 import enum
+import functools
+import struct
 import typing
 
 from ._types import StrOrBytes
@@ -38,13 +40,51 @@ class SOCKS5AType(bytes, enum.Enum):
 
     @classmethod
     def from_atype(cls, atype: AddressType) -> "SOCKS5AType":
-        if atype == AddressType.IPV4:
-            return SOCKS5AType.IPV4_ADDRESS
-        elif atype == AddressType.DN:
-            return SOCKS5AType.DOMAIN_NAME
-        elif atype == AddressType.IPV6:
-            return SOCKS5AType.IPV6_ADDRESS
-        raise ValueError(atype)
+        try:
+            return _ATYPE_MAP[atype]
+        except KeyError:
+            raise ValueError(atype) from None
+
+
+# AddressType to SOCKS5AType, built once at import time so from_atype is a
+# single dict lookup instead of a branch chain.
+_ATYPE_MAP = {
+    AddressType.IPV4: SOCKS5AType.IPV4_ADDRESS,
+    AddressType.DN: SOCKS5AType.DOMAIN_NAME,
+    AddressType.IPV6: SOCKS5AType.IPV6_ADDRESS,
+}
+
+
+# Precompiled structs for the fixed-size portions of requests. The command
+# and address-type fields use '1s' so the bytes-valued enums pack directly.
+_REQUEST_HEADER_STRUCT = struct.Struct(">B1sB1s")
+_PORT_STRUCT = struct.Struct(">H")
+
+# Bound unpack of the port struct, avoiding int.from_bytes' keyword parsing
+# and a per-call attribute lookup on the hot parse path.
+_unpack_u16 = _PORT_STRUCT.unpack_from
+
+# Fully fused request structs for the fixed-size address types, selected by
+# address type. Domain names are variable-length and fall back to the header
+# struct plus a join.
+_REQUEST_STRUCTS = {
+    SOCKS5AType.IPV4_ADDRESS: struct.Struct(">B1sB1s4sH"),
+    SOCKS5AType.IPV6_ADDRESS: struct.Struct(">B1sB1s16sH"),
+}
+
+# Precompiled structs for reply parsing: the fixed 4-byte prefix and the
+# fused address-plus-port tail for the fixed-size address types.
+_REPLY_PREFIX_STRUCT = struct.Struct(">BBBB")
+_REPLY_TAIL_STRUCTS = {
+    SOCKS5AType.IPV4_ADDRESS: struct.Struct(">4sH"),
+    SOCKS5AType.IPV6_ADDRESS: struct.Struct(">16sH"),
+}
+
+
+@functools.lru_cache(maxsize=64)
+def _username_password_struct(username_len: int, password_len: int) -> struct.Struct:
+    """Returns a cached struct packing a whole username/password request."""
+    return struct.Struct(f">BB{username_len}sB{password_len}s")
 
 
 class SOCKS5ReplyCode(bytes, enum.Enum):
@@ -61,6 +101,15 @@ class SOCKS5ReplyCode(bytes, enum.Enum):
     ADDRESS_TYPE_NOT_SUPPORTED = b"\x08"
 
 
+# Enum members by integer wire value, so the ints coming out of unpacks and
+# indexing look up the member directly. A dict lookup stays in C, unlike the
+# enum's __call__ which runs Python-level missing-value machinery on the hot
+# path.
+_REPLY_CODES = {code[0]: code for code in SOCKS5ReplyCode}
+_AUTH_METHODS = {method[0]: method for method in SOCKS5AuthMethod}
+_ATYPES = {atype[0]: atype for atype in SOCKS5AType}
+
+
 class SOCKS5AuthMethodsRequest(typing.NamedTuple):
     """Encapsulates a request to the proxy for available authentication methods.
 
@@ -73,13 +122,16 @@ class SOCKS5AuthMethodsRequest(typing.NamedTuple):
     def dumps(self) -> bytes:
         """Packs the instance into a raw binary in the appropriate form."""
 
-        return b"".join(
-            [
-                b"\x05",
-                len(self.methods).to_bytes(1, byteorder="big"),
-                b"".join(self.methods),
-            ]
-        )
+        # Pre-size the buffer and write each method byte straight into it,
+        # the header fields are single bytes so plain index assignment beats
+        # both struct packing and a join.
+        count = len(self.methods)
+        buf = bytearray(2 + count)
+        buf[0] = 5
+        buf[1] = count
+        for i, method in enumerate(self.methods):
+            buf[2 + i] = method[0]
+        return bytes(buf)
 
 
 class SOCKS5AuthReply(typing.NamedTuple):
@@ -108,9 +160,11 @@ class SOCKS5AuthReply(typing.NamedTuple):
             raise ProtocolError("Malformed reply")
 
         try:
-            return cls(method=SOCKS5AuthMethod(data[1:2]))
-        except ValueError as exc:
-            raise ProtocolError("Malformed reply") from exc
+            method = _AUTH_METHODS[data[1]]
+        except KeyError:
+            raise ProtocolError("Malformed reply") from None
+
+        return cls(method)
 
 
 class SOCKS5UsernamePasswordRequest(typing.NamedTuple):
@@ -125,14 +179,10 @@ class SOCKS5UsernamePasswordRequest(typing.NamedTuple):
         Returns:
             The packed request.
         """
-        return b"".join(
-            [
-                b"\x01",
-                len(self.username).to_bytes(1, byteorder="big"),
-                self.username,
-                len(self.password).to_bytes(1, byteorder="big"),
-                self.password,
-            ]
+        username_len = len(self.username)
+        password_len = len(self.password)
+        return _username_password_struct(username_len, password_len).pack(
+            1, username_len, self.username, password_len, self.password
         )
 
 
@@ -148,7 +198,7 @@ class SOCKS5UsernamePasswordReply(typing.NamedTuple):
         Returns:
             The unpacked authentication reply instance.
         """
-        return cls(success=data == b"\x01\x00")
+        return cls(data == b"\x01\x00")
 
 
 class SOCKS5CommandRequest(typing.NamedTuple):
@@ -200,16 +250,23 @@ class SOCKS5CommandRequest(typing.NamedTuple):
         Returns:
             The packed request.
         """
-        return b"".join(
-            [
-                b"\x05",
-                self.command,
-                b"\x00",
-                self.atype,
-                self.packed_addr,
-                (self.port).to_bytes(2, byteorder="big"),
-            ]
-        )
+        fused = _REQUEST_STRUCTS.get(self.atype)
+        if fused is not None:
+            # packed_addr validates the address length, '4s'/'16s' would
+            # silently truncate or zero-pad a mis-sized address.
+            return fused.pack(
+                5, self.command, 0, self.atype, self.packed_addr, self.port
+            )
+
+        # Variable-length path: pre-size the buffer and write the header,
+        # address, and port straight into it.
+        packed_addr = self.packed_addr
+        addr_len = len(packed_addr)
+        buf = bytearray(6 + addr_len)
+        _REQUEST_HEADER_STRUCT.pack_into(buf, 0, 5, self.command, 0, self.atype)
+        buf[4 : 4 + addr_len] = packed_addr
+        _PORT_STRUCT.pack_into(buf, 4 + addr_len, self.port)
+        return bytes(buf)
 
     @property
     def packed_addr(self) -> bytes:
@@ -225,6 +282,57 @@ class SOCKS5CommandRequest(typing.NamedTuple):
             return length.to_bytes(1, byteorder="big") + self.addr
 
 
+def _parse_reply(
+    data: bytes,
+) -> typing.Tuple["SOCKS5ReplyCode", "SOCKS5AType", str, int]:
+    """Parses raw reply data into a (reply_code, atype, addr, port) tuple.
+
+    Raises:
+        ProtocolError: If the data does not match the spec.
+    """
+    if len(data) < 4 or data[0] != 5:
+        raise ProtocolError("Malformed reply")
+
+    _, raw_code, _, raw_atype = _REPLY_PREFIX_STRUCT.unpack_from(data)
+
+    try:
+        reply_code = _REPLY_CODES[raw_code]
+        atype = _ATYPES[raw_atype]
+    except KeyError:
+        raise ProtocolError("Malformed reply") from None
+
+    tail = _REPLY_TAIL_STRUCTS.get(atype)
+    if tail is not None:
+        # Exact match: trailing bytes would be silently dropped otherwise,
+        # the connection reports no consumed-byte count to the caller.
+        if len(data) != 4 + tail.size:
+            raise ProtocolError("Malformed reply")
+        addr, port = tail.unpack_from(data, 4)
+    else:
+        # Domain names span everything between the prefix and port.
+        if len(data) < 6:
+            raise ProtocolError("Malformed reply")
+        addr = data[4:-2]
+        port = _unpack_u16(data, len(data) - 2)[0]
+
+    try:
+        decoded_addr = decode_address(AddressType.from_socks5_atype(atype), addr)
+    except ValueError:
+        raise ProtocolError("Malformed reply") from None
+
+    return reply_code, atype, decoded_addr, port
+
+
+try:  # pragma: nocover
+    # Optional compiled parser with the same signature and ProtocolError
+    # semantics as _parse_reply above. socksio itself stays pure-Python, this
+    # is a drop-in point for users embedding socksio in high-throughput
+    # proxies who want to sidestep the interpreter for per-packet parsing.
+    from ._fast import parse_socks5_reply as _parse_reply  # type: ignore # noqa: F811
+except ImportError:
+    pass
+
+
 class SOCKS5Reply(typing.NamedTuple):
     """Encapsulates a reply from the SOCKS5 proxy server
 
@@ -250,20 +358,7 @@ class SOCKS5Reply(typing.NamedTuple):
         Raises:
             ProtocolError: If the data does not match the spec.
         """
-        if data[0:1] != b"\x05":
-            raise ProtocolError("Malformed reply")
-
-        try:
-            atype = SOCKS5AType(data[3:4])
-
-            return cls(
-                reply_code=SOCKS5ReplyCode(data[1:2]),
-                atype=atype,
-                addr=decode_address(AddressType.from_socks5_atype(atype), data[4:-2]),
-                port=int.from_bytes(data[-2:], byteorder="big"),
-            )
-        except ValueError as exc:
-            raise ProtocolError("Malformed reply") from exc
+        return cls(*_parse_reply(data))
 
 
 class SOCKS5Datagram(typing.NamedTuple):
@@ -311,7 +406,7 @@ class SOCKS5Connection:
     """
 
     def __init__(self) -> None:
-        self._data_to_send = bytearray()
+        self._data_to_send: typing.List[bytes] = []
         self._received_data = bytearray()
         self._state = SOCKS5State.CLIENT_AUTH_REQUIRED
 
@@ -333,7 +428,7 @@ class SOCKS5Connection:
 
     @send.register(SOCKS5AuthMethodsRequest)
     def _auth_methods(self, request: SOCKS5AuthMethodsRequest) -> None:
-        self._data_to_send += request.dumps()
+        self._data_to_send.append(request.dumps())
         self._state = SOCKS5State.SERVER_AUTH_REPLY
 
     @send.register(SOCKS5UsernamePasswordRequest)
@@ -341,7 +436,7 @@ class SOCKS5Connection:
         if self._state != SOCKS5State.CLIENT_WAITING_FOR_USERNAME_PASSWORD:
             raise ProtocolError("Not currently waiting for username and password")
         self._state = SOCKS5State.SERVER_VERIFY_USERNAME_PASSWORD
-        self._data_to_send += request.dumps()
+        self._data_to_send.append(request.dumps())
 
     @send.register(SOCKS5CommandRequest)
     def _command(self, request: SOCKS5CommandRequest) -> None:
@@ -349,7 +444,7 @@ class SOCKS5Connection:
             raise ProtocolError(
                 "SOCKS5 connections must be authenticated before sending a request"
             )
-        self._data_to_send += request.dumps()
+        self._data_to_send.append(request.dumps())
 
     def receive_data(
         self, data: bytes
@@ -394,6 +489,10 @@ class SOCKS5Connection:
 
         Also clears the connection's buffer.
         """
-        data = bytes(self._data_to_send)
-        self._data_to_send = bytearray()
-        return data
+        data = self._data_to_send
+        self._data_to_send = []
+        # The typical case is a single queued request, skip the join's
+        # scan and reallocation and hand its bytes back as-is.
+        if len(data) == 1:
+            return data[0]
+        return b"".join(data)
@@ -31,7 +31,7 @@ class AddressType(enum.Enum):
         raise ValueError(socks5atype)
 
 
-@functools.lru_cache(maxsize=64)
+@functools.lru_cache(maxsize=256)
 def encode_address(addr: StrOrBytes) -> typing.Tuple[AddressType, bytes]:
     """Determines the type of address and encodes it into the format SOCKS expects"""
     addr = addr.decode() if isinstance(addr, bytes) else addr
@@ -44,7 +44,7 @@ def encode_address(addr: StrOrBytes) -> typing.Tuple[AddressType, bytes]:
             return AddressType.DN, addr.encode()
 
 
-@functools.lru_cache(maxsize=64)
+@functools.lru_cache(maxsize=1024)
 def decode_address(address_type: AddressType, encoded_addr: bytes) -> str:
     """Decodes the address from a SOCKS reply"""
     if address_type == AddressType.IPV6:
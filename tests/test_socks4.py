@@ -9,6 +9,7 @@ from socksio import (
     SOCKS4ReplyCode,
     SOCKS4Request,
     SOCKSError,
+    build_socks4_reply,
 )
 
 
@@ -98,6 +99,18 @@ def test_socks4_connection_request(command: SOCKS4Command) -> None:
     assert data[13] == 0
 
 
+def test_socks4_connection_queues_multiple_requests() -> None:
+    conn = SOCKS4Connection(user_id=b"socks")
+    request = SOCKS4Request.from_address(
+        command=SOCKS4Command.CONNECT, address=("127.0.0.1", 8080)
+    )
+    conn.send(request)
+    conn.send(request)
+
+    assert conn.data_to_send() == request.dumps(user_id=b"socks") * 2
+    assert conn.data_to_send() == b""
+
+
 @pytest.mark.parametrize("request_reply_code", list(SOCKS4ReplyCode))
 def test_socks4_receive_data(request_reply_code: bytes) -> None:
     conn = SOCKS4Connection(user_id=b"socks")
@@ -133,6 +146,24 @@ def test_socks4_receive_malformed_data(data: bytes) -> None:
         conn.receive_data(data)
 
 
+@pytest.mark.parametrize("reply_code", list(SOCKS4ReplyCode))
+def test_build_socks4_reply(reply_code: SOCKS4ReplyCode) -> None:
+    data = build_socks4_reply(reply_code, 8080, b"\x7f\x00\x00\x01")
+
+    assert data == b"".join(
+        [
+            b"\x00",
+            reply_code,
+            (8080).to_bytes(2, byteorder="big"),
+            b"\x7f\x00\x00\x01",
+        ]
+    )
+    assert data == build_socks4_reply(reply_code[0], 8080, b"\x7f\x00\x00\x01")
+    assert SOCKS4Reply.loads(data) == SOCKS4Reply(
+        reply_code=reply_code, port=8080, addr="127.0.0.1"
+    )
+
+
 @pytest.mark.parametrize("command", [SOCKS4Command.BIND, SOCKS4Command.CONNECT])
 def test_SOCKS4A_connection_request(command: SOCKS4Command) -> None:
     conn = SOCKS4Connection(user_id=b"socks")
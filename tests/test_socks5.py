@@ -272,6 +272,19 @@ def test_socks5_request_ipv6(
     assert data[20:] == (1080).to_bytes(2, byteorder="big")
 
 
+def test_socks5_connection_queues_multiple_requests(
+    authenticated_conn: SOCKS5Connection,
+) -> None:
+    cmd_request = SOCKS5CommandRequest.from_address(
+        SOCKS5Command.CONNECT, "127.0.0.1:1080"
+    )
+    authenticated_conn.send(cmd_request)
+    authenticated_conn.send(cmd_request)
+
+    assert authenticated_conn.data_to_send() == cmd_request.dumps() * 2
+    assert authenticated_conn.data_to_send() == b""
+
+
 @pytest.mark.parametrize(
     "atype,addr,expected_atype,expected_addr",
     [
@@ -319,6 +332,11 @@ def test_socks5_reply_success(
         b"\x00\x00\x00\x01\x7f\x00\x00\x01\x048",  # incorrect protocol version
         b"\x05\x00\x00\x01\x7f\x00\x00\x01\x04",  # missing one byte of port number
         b"\x05\x00\x00\x01\x7f\x00\x00\x048",  # missing one byte of address
+        b"\x05\x00\x00\x01\x7f\x00\x00\x01\x048Z",  # trailing bytes after the port
+        b"\x05\x09\x00\x01\x7f\x00\x00\x01\x048",  # unknown reply code
+        b"\x05\x00\x00\x02\x7f\x00\x00\x01\x048",  # unknown address type
+        b"\x05\x00\x00\x038",  # domain name truncated before the port
+        b"\x05\x00\x00\x03\xff\xfe\x048",  # domain name that is not valid UTF-8
     ],
 )
 def test_socks5_receive_malformed_data(